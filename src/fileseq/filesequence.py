@@ -7,12 +7,12 @@ import collections.abc
 import dataclasses
 import decimal
 import fnmatch
-import functools
 import operator
 import os
 import re
 import sys
 import typing
+import warnings
 from glob import iglob
 
 from . import constants, utils
@@ -23,6 +23,7 @@ from .constants import (
     UDIM_PADDING_PATTERNS)
 from .exceptions import ParseException, FileSeqException
 from .frameset import FrameSet
+from .utils import asString
 
 
 class FileSequence:
@@ -38,6 +39,10 @@ class FileSequence:
             :class:`fileseq.exceptions.MaxSizeException`: If frame size exceeds
             ``fileseq.constants.MAX_FRAME_SIZE``
     """
+    __slots__ = (
+        '_base', '_decimal_places', '_dir', '_ext', '_frameSet', '_frame_pad',
+        '_pad', '_pad_style', '_str', '_subframe_pad', '_zfill')
+
     _base: str
     _decimal_places: int
     _dir: str
@@ -45,8 +50,11 @@ class FileSequence:
     _frameSet: FrameSet|None
     _frame_pad: str
     _pad: str
+    _pad_style: constants._PadStyle
+    _str: str|None
     _subframe_pad: str
-    
+    _zfill: int
+
     DISK_RE = DISK_RE
     DISK_SUB_RE = DISK_SUB_RE
     PAD_MAP = PAD_MAP
@@ -70,7 +78,8 @@ class FileSequence:
                  allow_subframes: bool = False):
         """Init the class
         """
-        sequence = utils.asString(sequence)
+        sequence = asString(sequence)
+        self._str = None
 
         if not hasattr(self, '_frameSet'):
 
@@ -156,7 +165,11 @@ class FileSequence:
             :class:`.FileSequence`:
         """
         fs = self.__class__.__new__(self.__class__)
-        fs.__dict__ = self.__dict__.copy()
+        for name in FileSequence.__slots__:
+            setattr(fs, name, getattr(self, name))
+        # subclasses that do not define __slots__ may carry extra state
+        if hasattr(self, '__dict__'):
+            fs.__dict__.update(self.__dict__)
         fs._frameSet = None
         if self._frameSet is not None:
             fs._frameSet = self._frameSet.copy()
@@ -242,12 +255,13 @@ class FileSequence:
         """
         # Make sure the dirname always ends in
         # a path separator character
-        dirname = utils.asString(dirname)
+        dirname = asString(dirname)
         sep = utils._getPathSep(dirname)
         if not dirname.endswith(sep):
             dirname = str(dirname) + sep
 
         self._dir = dirname
+        self._str = None
 
     def basename(self) -> str:
         """
@@ -265,7 +279,8 @@ class FileSequence:
         Args:
             base (str): the new base name
         """
-        self._base = utils.asString(base)
+        self._base = asString(base)
+        self._str = None
 
     def padStyle(self) -> constants._PadStyle:
         """
@@ -312,6 +327,7 @@ class FileSequence:
         self._pad = pad
         self._frame_pad = frame_pad
         self._subframe_pad = subframe_pad
+        self._str = None
 
     def padding(self) -> str:
         """
@@ -345,6 +361,7 @@ class FileSequence:
         self._subframe_pad = subframe_pad
         self._zfill = zfill
         self._decimal_places = decimal_places
+        self._str = None
 
     def framePadding(self) -> str:
         """
@@ -379,6 +396,7 @@ class FileSequence:
         self._frame_pad = padding
         self._pad = pad
         self._zfill = zfill
+        self._str = None
 
     def subframePadding(self) -> str:
         """
@@ -415,6 +433,7 @@ class FileSequence:
         self._subframe_pad = subframe_pad
         self._pad = pad
         self._decimal_places = decimal_places
+        self._str = None
 
     def frameSet(self) -> FrameSet|None:
         """
@@ -440,6 +459,7 @@ class FileSequence:
                     for frame in frameSet
                 ])
         self._frameSet = frameSet
+        self._str = None
 
         if not self._pad:
             self.setPadding(self._DEFAULT_PAD_CHAR)
@@ -465,7 +485,8 @@ class FileSequence:
         """
         if ext and ext[0] != ".":
             ext = "." + ext
-        self._ext = utils.asString(ext)
+        self._ext = asString(ext)
+        self._str = None
 
     def setExtention(self, ext: str) -> None:
         """
@@ -474,7 +495,6 @@ class FileSequence:
         Args:
             ext (str):
         """
-        import warnings
         msg = "the setExtention method is deprecated, please use setExtension"
         warnings.warn(msg)
         self.setExtension(ext)
@@ -499,6 +519,7 @@ class FileSequence:
             frange (str): a properly formatted frame range, as per :class:`.FrameSet`
         """
         self._frameSet = FrameSet(frange)
+        self._str = None
         if not self._pad:
             self.setPadding(self._DEFAULT_PAD_CHAR)
 
@@ -639,19 +660,41 @@ class FileSequence:
         frame_gen = utils.batchFrames(0, len(self) - 1, batch_size)
         return (self[f.start:f.stop + 1] for f in frame_gen)
 
+    def __getstate__(self) -> dict[str, typing.Any]:
+        """
+        Allows for serialization to a pickled :class:`FileSequence`.
+
+        Returns:
+            dict: state of the current sequence object
+        """
+        state = {
+            name: getattr(self, name)
+            for name in FileSequence.__slots__
+            if name != '_str' and hasattr(self, name)
+        }
+        # subclasses that do not define __slots__ may carry extra state
+        state.update(getattr(self, '__dict__', {}))
+        return state
+
     def __setstate__(self, state: typing.Any) -> None:
         """
         Allows for de-serialization from a pickled :class:`FileSequence`.
 
         Args:
-            state (dict): Pickle dictionary produced by default pickle implementation
+            state (dict): Pickle dictionary produced by :meth:`__getstate__`,
+                or by the default pickle implementation of older versions
         """
         for name, value in state.items():
-            self.__dict__[name] = value
-        self.__dict__.setdefault('_pad_style', PAD_STYLE_DEFAULT)
-        self.__dict__.setdefault('_frame_pad', self._pad)
-        self.__dict__.setdefault('_subframe_pad', '')
-        self.__dict__.setdefault('_decimal_places', 0)
+            setattr(self, name, value)
+        if not hasattr(self, '_pad_style'):
+            self._pad_style = PAD_STYLE_DEFAULT
+        if not hasattr(self, '_frame_pad'):
+            self._frame_pad = self._pad
+        if not hasattr(self, '_subframe_pad'):
+            self._subframe_pad = ''
+        if not hasattr(self, '_decimal_places'):
+            self._decimal_places = 0
+        self._str = None
 
     def to_dict(self) -> dict[str, typing.Any]:
         """
@@ -661,7 +704,7 @@ class FileSequence:
         Returns:
             dict: state of the current sequence object
         """
-        state = self.__dict__.copy()
+        state = self.__getstate__()
         state['_pad_style'] = str(self._pad_style)
         state['_frameSet'] = None
         if self._frameSet is not None:
@@ -703,11 +746,25 @@ class FileSequence:
         # If there is no frame range, or there is no padding
         # characters, then we only want to represent a single path
         if not self._frameSet or not self._zfill:
-            yield utils.asString(self)
+            yield asString(self)
             return
 
+        if self._decimal_places:
+            for f in self._frameSet:
+                yield self.frame(f)
+            return
+
+        # Integer frames are the common case. Bake the path components
+        # and zfill into a format spec once, instead of going through
+        # the general frame() conversion and padding for every path.
+        prefix = self._dir + self._base
+        ext = self._ext
+        spec = '0{}d'.format(self._zfill)
         for f in self._frameSet:
-            yield self.frame(f)
+            if isinstance(f, int):
+                yield prefix + format(f, spec) + ext
+            else:
+                yield self.frame(f)
 
     def __getitem__(self, idx: typing.Any) -> str|FileSequence:
         """
@@ -769,9 +826,11 @@ class FileSequence:
         Returns:
             str:
         """
-        cmpts = self.__components()
-        cmpts.frameSet = utils.asString(cmpts.frameSet or "")
-        return "".join(dataclasses.astuple(cmpts))
+        if self._str is None:
+            cmpts = self.__components()
+            cmpts.frameSet = asString(cmpts.frameSet or "")
+            self._str = "".join(dataclasses.astuple(cmpts))
+        return self._str
 
     def __repr__(self) -> str:
         try:
@@ -865,7 +924,7 @@ class FileSequence:
             frames: set[str] = set()
 
             path: str
-            for path in filter(None, map(utils.asString, paths)):
+            for path in filter(None, map(asString, paths)):
                 frame = path[head:tail]
                 try:
                     int(frame)
@@ -881,7 +940,7 @@ class FileSequence:
                 seqs.setdefault(key, frames).add(frame)
 
         else:
-            for match in filter(None, map(_check, map(utils.asString, paths))):
+            for match in filter(None, map(_check, map(asString, paths))):
                 dirname, basename, frame, ext = match.groups()
                 if not basename and not ext:
                     continue
@@ -896,6 +955,7 @@ class FileSequence:
 
         def start_new_seq() -> FileSequence:
             seq = cls.__new__(cls)
+            seq._str = None
             seq._dir = dirname or ''
             seq._base = basename or ''
             seq._ext = ext or ''
@@ -907,7 +967,7 @@ class FileSequence:
             else:
                 seq._pad = seq._frame_pad
 
-            seq.__init__(utils.asString(seq), pad_style=pad_style,  # type: ignore[misc]
+            seq.__init__(asString(seq), pad_style=pad_style,  # type: ignore[misc]
                          allow_subframes=allow_subframes)
 
         def get_frame_width(frame_str: str) -> int:
@@ -1041,7 +1101,6 @@ class FileSequence:
             list:
         """
         # reserve some functions we're going to need quick access to
-        _not_hidden = lambda f: not f.startswith('.')
         _match_pattern = None
         _filter_padding = None
         _join = os.path.join
@@ -1086,12 +1145,8 @@ class FileSequence:
 
             if seq.padding() and strictPadding:
                 get_frame = lambda f: _match_pattern(f).group(1)  # type: ignore
-                _filter_padding = functools.partial(
-                    cls._filterByPaddingNum,
-                    zfill=seq.zfill(),
-                    decimal_places=seq.decimalPlaces(),
-                    get_frame=get_frame
-                )
+                _filter_padding = lambda it, _z=seq.zfill(), _d=seq.decimalPlaces(): (
+                    cls._filterByPaddingNum(it, _z, decimal_places=_d, get_frame=get_frame))
 
         # Get just the immediate files under the dir.
         # Avoids testing the os.listdir() for files as
@@ -1099,13 +1154,13 @@ class FileSequence:
         ret = next(os.walk(dirpath), None)
         files: typing.Iterable[str] = ret[-1] if ret else []
 
-        # collapse some generators to get us the files that match our regex
-        if not include_hidden:
-            files = filter(_not_hidden, files)
-
-        # Filter by files that match the provided file pattern
-        if _match_pattern:
-            files = filter(_match_pattern, files)
+        # Filter out hidden files, and files that don't match the
+        # provided file pattern, in a single pass
+        files = [
+            f for f in files
+            if (include_hidden or not f.startswith('.'))
+            and (_match_pattern is None or _match_pattern(f))
+        ]
 
         # Filter by files that match the frame padding in the file pattern
         if _filter_padding:
@@ -1358,9 +1413,13 @@ class FileSequence:
             has_padded_subframe = False
 
             def check_padded(frame: str) -> bool:
-                if frame and (frame[0] == '0' or frame[:2] == '-0'):
+                # compare single characters to avoid slicing a new string
+                if not frame:
+                    return False
+                first = frame[0]
+                if first == '0':
                     return True
-                return False
+                return first == '-' and len(frame) > 1 and frame[1] == '0'
 
             def set_has_padded() -> None:
                 if has_padded_frame:
@@ -1488,7 +1547,7 @@ class FileSequence:
             msg = "Detected an unsupported padding character: \"{}\"."
             msg += " Supported padding characters: {}, printf, houdini or UDIM syntax padding"
             msg += " %<int>d"
-            raise ValueError(msg.format(char, utils.asString(list(cls.PAD_MAP))))
+            raise ValueError(msg.format(char, asString(list(cls.PAD_MAP))))
 
     @classmethod
     def conformPadding(cls, chars: str, pad_style: constants._PadStyle = PAD_STYLE_DEFAULT) -> str:
@@ -4,6 +4,8 @@ frameset - A set-like object representing a frame range for fileseq.
 from __future__ import annotations
 
 import decimal
+import functools
+import itertools
 import numbers
 import re
 import typing
@@ -13,10 +15,56 @@ from typing import Union
 from . import constants  # constants.MAX_FRAME_SIZE updated during tests
 from .constants import PAD_MAP, FRANGE_RE, PAD_RE
 from .exceptions import MaxSizeException, ParseException
-from .utils import (asString, xfrange, unique, pad, quantize,
+from .utils import (asString, xfrange, pad, quantize,
                     normalizeFrame, normalizeFrames, batchIterable)
 
 
+@functools.lru_cache(maxsize=None)
+def _padStripTable(chars: str) -> dict[int, int | None]:
+    """
+    Build a ``str.translate`` table that deletes the given padding characters.
+    Tables are cached by the characters, so a modified ``PAD_MAP`` still
+    produces a matching table.
+
+    Args:
+        chars (str): padding characters to delete
+
+    Returns:
+        dict:
+    """
+    return str.maketrans('', '', chars)
+
+
+def _intFrameRange(start: int, stop: int, step: int = 1, maxSize: int = -1) -> range:
+    """
+    Integer only version of :func:`fileseq.utils.xfrange`, which returns
+    a builtin ``range`` instead of wrapping it in a generator, so that
+    iterating it stays in C.
+
+    Args:
+        start (int):
+        stop (int):
+        step (int): Note that the sign will be ignored
+        maxSize (int):
+
+    Returns:
+        range:
+
+    Raises:
+        :class:`fileseq.exceptions.MaxSizeException`: if size is exceeded
+    """
+    if not step:
+        raise ValueError('xfrange() step argument must not be zero')
+
+    step = abs(step) if start <= stop else -abs(step)
+    size = (stop - start) // step + 1
+    if 0 <= maxSize < size:
+        raise MaxSizeException(
+            "Size %d > %s (MAX_FRAME_SIZE)" % (size, maxSize))
+
+    return range(start, stop + (1 if step > 0 else -1), step)
+
+
 class FrameSet(Set):  # type:ignore[type-arg]
     """
     A ``FrameSet`` is an immutable representation of the ordered, unique
@@ -83,10 +131,29 @@ class FrameSet(Set):  # type:ignore[type-arg]
     PAD_MAP = PAD_MAP
     PAD_RE = PAD_RE
 
-    __slots__ = ('_frange', '_items', '_order')
+    __slots__ = ('_frange', '_items', '_order', '_is_consecutive', '_index_map', '_cached_hash',
+                 '_frame_range_cache', '_has_subframes')
 
+    # the slots holding the parsed range; the rest are lazily computed caches
+    _DATA_SLOTS = ('_frange', '_items', '_order')
+
+    _frange: str | None
     _items: frozenset[int]
     _order: tuple[int, ...]
+    _is_consecutive: bool | None
+    _has_subframes: bool | None
+    _index_map: dict[int, int] | None
+    _cached_hash: int | None
+    _frame_range_cache: dict[tuple[typing.Any, ...], str] | None
+
+    # shared empty result of set operations, see _empty_frameset()
+    _EMPTY: typing.ClassVar[FrameSet | None] = None
+
+    # cached frame range parses, see _parse_frange(). Each entry holds all
+    # of its frames, so only small ranges are kept.
+    _PARSE_CACHE: typing.ClassVar[dict[tuple[typing.Any, ...], tuple[frozenset[int], tuple[int, ...]]]] = {}
+    _PARSE_CACHE_SIZE = 1024
+    _PARSE_CACHE_MAX_FRAMES = 10000
 
     def __new__(cls, *args: typing.Any, **kwargs: typing.Any) -> FrameSet:
         """
@@ -102,8 +169,22 @@ class FrameSet(Set):  # type:ignore[type-arg]
                 ``fileseq.constants.MAX_FRAME_SIZE``
         """
         self = super(cls, FrameSet).__new__(cls)
+        self._reset_caches()
         return self
 
+    def _reset_caches(self) -> None:
+        """
+        Internal method: clear the lazily computed caches.
+
+        Pickle protocols 0 and 1 rebuild objects without calling
+        :meth:`__new__`, so :meth:`__setstate__` calls this as well.
+        """
+        self._is_consecutive = None
+        self._has_subframes = None
+        self._index_map = None
+        self._cached_hash = None
+        self._frame_range_cache = None
+
     def __init__(self, frange: typing.Any) -> None:
         """Initialize the :class:`FrameSet` object.
         """
@@ -114,11 +195,24 @@ class FrameSet(Set):  # type:ignore[type-arg]
             except (TypeError, ValueError) as e:
                 raise ParseException('FrameSet args parsing error: {}'.format(e)) from e
 
+        def check_frames(frames: tuple[typing.Any, ...]) -> None:
+            # the frame range string is built lazily, so reject the
+            # non-numeric frames that building it would fail on
+            if len(frames) > 1 and not isinstance(frames[0], numbers.Number):
+                msg = 'FrameSet args parsing error: non-numeric frames {!r}'
+                raise ParseException(msg.format(frames))
+
         # if the user provides anything but a string, short-circuit the build
         if not isinstance(frange, (str,)):
-            # if it's apparently a FrameSet already, short-circuit the build
-            if set(dir(frange)).issuperset(self.__slots__):
-                for attr in self.__slots__:
+            # if it's a FrameSet already, short-circuit the build,
+            # sharing its parsed range and any cached results
+            if isinstance(frange, FrameSet):
+                for attr in FrameSet.__slots__:
+                    setattr(self, attr, getattr(frange, attr))
+                return
+            # if it's apparently a FrameSet, copy its parsed range
+            elif all(hasattr(frange, attr) for attr in self._DATA_SLOTS):
+                for attr in self._DATA_SLOTS:
                     setattr(self, attr, getattr(frange, attr))
                 return
             # if it's inherently disordered, sort and build
@@ -126,18 +220,20 @@ class FrameSet(Set):  # type:ignore[type-arg]
                 self._maxSizeCheck(frange)
                 self._items = frozenset(catch_parse_err(normalizeFrames, frange))  # type: ignore
                 self._order = tuple(sorted(self._items))
-                self._frange = catch_parse_err(  # type: ignore
-                    self.framesToFrameRange, self._order, sort=False, compress=False)
+                check_frames(self._order)
+                # the frame range string is built on first access
+                self._frange = None
                 return
             # if it's ordered, find unique and build
             elif isinstance(frange, Sized) and isinstance(frange, Iterable):
                 self._maxSizeCheck(frange)
-                items: typing.Set[int] = set()
-                order = unique(items, catch_parse_err(normalizeFrames, frange))  # type: ignore
+                # dict keys are unique and keep their insertion order
+                order = dict.fromkeys(catch_parse_err(normalizeFrames, frange))  # type: ignore
                 self._order = tuple(order)
-                self._items = frozenset(items)
-                self._frange = catch_parse_err(  # type: ignore
-                    self.framesToFrameRange, self._order, sort=False, compress=False)
+                self._items = frozenset(order)
+                check_frames(self._order)
+                # the frame range string is built on first access
+                self._frange = None
                 return
             # if it's an individual number build directly
             elif isinstance(frange, (int, float, decimal.Decimal)):
@@ -156,10 +252,7 @@ class FrameSet(Set):  # type:ignore[type-arg]
 
         # we're willing to trim padding characters from consideration
         # this translation is orders of magnitude faster than prior method
-        frange = str(frange)
-        for key in self.PAD_MAP:
-            frange = frange.replace(key, '')
-        self._frange = asString(frange)
+        self._frange = str(frange).translate(_padStripTable(''.join(self.PAD_MAP)))
 
         # because we're acting like a set, we need to support the empty set
         if not self._frange:
@@ -167,70 +260,7 @@ class FrameSet(Set):  # type:ignore[type-arg]
             self._order = tuple()
             return
 
-        # build the mutable stores, then cast to immutable for storage
-        items = set()
-        order_f: typing.List[int] = []
-
-        maxSize = constants.MAX_FRAME_SIZE
-
-        frange_parts: typing.List[typing.Any] = []
-        frange_types: typing.List[typing.Any] = []
-        for part in self._frange.split(","):
-            # this is to deal with leading / trailing commas
-            if not part:
-                continue
-            # parse the partial range
-            start, end, modifier, chunk = self._parse_frange_part(part)
-            frange_parts.append((start, end, modifier, chunk))
-            frange_types.extend(map(type, (start, end, chunk)))
-
-        # Determine best type for numbers in range. Note that
-        # _parse_frange_part will always return decimal.Decimal for subframes
-        FrameType = int
-        if decimal.Decimal in frange_types:
-            FrameType = decimal.Decimal  # type: ignore
-
-        for start, end, modifier, chunk in frange_parts:
-            # handle batched frames (1-100x5)
-            if modifier == 'x':
-                frames = xfrange(start, end, chunk, maxSize=maxSize)
-                frames = [FrameType(f) for f in frames if f not in items]  # type: ignore
-                self._maxSizeCheck(len(frames) + len(items))  # type: ignore
-                order_f.extend(frames)
-                items.update(frames)
-            # handle staggered frames (1-100:5)
-            elif modifier == ':':
-                if '.' in str(chunk):
-                    raise ValueError("Unable to stagger subframes")
-                for stagger in range(chunk, 0, -1):
-                    frames = xfrange(start, end, stagger, maxSize=maxSize)
-                    frames = [f for f in frames if f not in items]  # type: ignore
-                    self._maxSizeCheck(len(frames) + len(items))  # type: ignore
-                    order_f.extend(frames)
-                    items.update(frames)
-            # handle filled frames (1-100y5)
-            elif modifier == 'y':
-                if '.' in str(chunk):
-                    raise ValueError("Unable to fill subframes")
-                not_good = frozenset(xfrange(start, end, chunk, maxSize=maxSize))
-                frames = xfrange(start, end, 1, maxSize=maxSize)
-                frames = (f for f in frames if f not in not_good)
-                frames = [f for f in frames if f not in items]  # type: ignore
-                self._maxSizeCheck(len(frames) + len(items))  # type: ignore
-                order_f.extend(frames)
-                items.update(frames)
-            # handle full ranges and single frames
-            else:
-                frames = xfrange(start, end, 1 if start < end else -1, maxSize=maxSize)
-                frames = [FrameType(f) for f in frames if f not in items]  # type: ignore
-                self._maxSizeCheck(len(frames) + len(items))  # type: ignore
-                order_f.extend(frames)
-                items.update(frames)
-
-        # lock the results into immutable internals
-        # this allows for hashing and fast equality checking
-        self._items = frozenset(items)
-        self._order = tuple(order_f)
+        self._items, self._order = self._parse_frange(self._frange, constants.MAX_FRAME_SIZE)
 
     @property
     def is_null(self) -> bool:
@@ -241,7 +271,7 @@ class FrameSet(Set):  # type:ignore[type-arg]
         Returns:
             bool:
         """
-        return not (self._frange and self._items and self._order)
+        return not self._order
 
     @property
     def frange(self) -> str:
@@ -251,7 +281,10 @@ class FrameSet(Set):  # type:ignore[type-arg]
         Returns:
             str:
         """
-        return self._frange or ''
+        if self._frange is None:
+            self._frange = self.framesToFrameRange(
+                self._order, sort=False, compress=False)
+        return self._frange
 
     @property
     def items(self) -> frozenset[int]:
@@ -287,6 +320,56 @@ class FrameSet(Set):  # type:ignore[type-arg]
         """
         return FrameSet(sorted(frames) if sort else frames)
 
+    @classmethod
+    def _from_frozenset(cls, frames: frozenset[typing.Any]) -> FrameSet:
+        """
+        Internal method: build a sorted :class:`FrameSet` from the result of a
+        set operation.
+
+        Integer frames are already normalized, so they are stored directly
+        instead of going through :meth:`from_iterable`. Anything else, such
+        as a mix of integer frames and subframes, still gets normalized.
+
+        Args:
+            frames (frozenset): the frames of the new :class:`FrameSet`
+
+        Returns:
+            :class:`FrameSet`:
+        """
+        if not frames:
+            return cls._empty_frameset()
+        if not set(map(type, frames)) <= {int}:
+            return FrameSet(sorted(frames))
+
+        cls._maxSizeCheck(frames)
+        fs = FrameSet.__new__(FrameSet)
+        fs._items = frames
+        fs._order = tuple(sorted(frames))
+        fs._has_subframes = False
+        # the frame range string is built on first access
+        fs._frange = None
+        return fs
+
+    @classmethod
+    def _empty_frameset(cls) -> FrameSet:
+        """
+        Internal method: return the shared empty :class:`FrameSet`.
+
+        A :class:`FrameSet` is immutable, so set operations with an empty
+        result can all return the same instance.
+
+        Returns:
+            :class:`FrameSet`:
+        """
+        empty = FrameSet._EMPTY
+        if empty is None:
+            empty = FrameSet.__new__(FrameSet)
+            empty._items = frozenset()
+            empty._order = ()
+            empty._frange = ''
+            FrameSet._EMPTY = empty
+        return empty
+
     @classmethod
     def from_range(cls, start: int, end: int, step: int = 1) -> FrameSet:
         """
@@ -314,6 +397,19 @@ class FrameSet(Set):  # type:ignore[type-arg]
             step = normalizeFrame(step)  # type: ignore
             range_str = "{0}-{1}x{2}".format(start, end, step)
 
+        # integer ranges already describe their frames, so build them
+        # directly instead of parsing the range string back again.
+        # A negative step on an ascending range is left to the parser,
+        # which rejects it.
+        if isinstance(start, int) and isinstance(end, int) and (step > 0 or start >= end):
+            fs = FrameSet.__new__(FrameSet)
+            fs._frange = range_str
+            fs._order = tuple(_intFrameRange(
+                start, end, step, maxSize=constants.MAX_FRAME_SIZE))
+            fs._items = frozenset(fs._order)
+            fs._has_subframes = False
+            return fs
+
         return FrameSet(range_str)
 
     @classmethod
@@ -337,6 +433,39 @@ class FrameSet(Set):  # type:ignore[type-arg]
         except Exception:
             return NotImplemented
 
+    @classmethod
+    def _cast_to_items(cls, other: typing.Any) -> typing.Any:
+        """
+        Private method to simplify set operations that only need the frames
+        of `other`. Builtin collections are normalized straight into a
+        frozenset, without building the ordered frames of a :class:`FrameSet`.
+
+        Args:
+            other (:class:`FrameSet` or set or frozenset or iterable): item to be compared
+
+        Returns:
+            frozenset
+
+        Raises:
+            :class:`NotImplemented`: if a comparison is impossible
+        """
+        if isinstance(other, FrameSet):
+            return other.items
+        if isinstance(other, (set, frozenset, list, tuple, range)):
+            try:
+                cls._maxSizeCheck(other)
+                items = frozenset(normalizeFrames(other))
+            except Exception:
+                return NotImplemented
+            # match the FrameSet constructor, which rejects non-numeric frames
+            if len(items) > 1 and not isinstance(next(iter(items)), numbers.Number):
+                return NotImplemented
+            return items
+        other = cls._cast_to_frameset(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return other.items
+
     def index(self, frame: int) -> int:
         """
         Return the index of the given frame number within the :class:`FrameSet`.
@@ -350,7 +479,14 @@ class FrameSet(Set):  # type:ignore[type-arg]
         Raises:
             :class:`ValueError`: if frame is not in self
         """
-        return self.order.index(frame)
+        # build the lookup on first use, so repeated calls are not
+        # each a linear scan of the order
+        if self._index_map is None:
+            self._index_map = {f: i for i, f in enumerate(self._order)}
+        try:
+            return self._index_map[frame]
+        except (KeyError, TypeError):
+            raise ValueError('{0!r} is not in FrameSet'.format(frame)) from None
 
     def frame(self, index: int) -> int:
         """
@@ -387,9 +523,11 @@ class FrameSet(Set):  # type:ignore[type-arg]
             bool:
 
         """
-        return any(
-            isinstance(item, (float, decimal.Decimal)) for item in self.items
-        )
+        if self._has_subframes is None:
+            self._has_subframes = any(
+                isinstance(item, (float, decimal.Decimal)) for item in self.items
+            )
+        return self._has_subframes
 
     def start(self) -> int:
         """
@@ -431,7 +569,9 @@ class FrameSet(Set):  # type:ignore[type-arg]
         Returns:
             bool:
         """
-        return len(self) == abs(self.end() - self.start()) + 1
+        if self._is_consecutive is None:
+            self._is_consecutive = len(self) == abs(self.end() - self.start()) + 1
+        return self._is_consecutive
 
     def frameRange(self, zfill: int = 0, decimal_places: int | None = None) -> str:
         """
@@ -481,29 +621,55 @@ class FrameSet(Set):  # type:ignore[type-arg]
         Returns:
             str:
 
+        Raises:
+            :class:`fileseq.exceptions.MaxSizeException`:
+        """
+        if self._frame_range_cache is None:
+            self._frame_range_cache = {}
+        # the max frame size is part of the key, so that a lowered
+        # limit is still checked against. The type of zfill is too, so
+        # that an invalid width is never answered from the cache.
+        key = ('invertedFrameRange', zfill, type(zfill), constants.MAX_FRAME_SIZE)
+        if key not in self._frame_range_cache:
+            self._frame_range_cache[key] = self._invertedFrameRange(zfill)
+        return self._frame_range_cache[key]
+
+    def _invertedFrameRange(self, zfill: int) -> str:
+        """
+        Internal method: build the inverted frame range for
+        :meth:`invertedFrameRange`.
+
+        Args:
+            zfill (int): the width to use to zero-pad the frame range string
+
+        Returns:
+            str:
+
         Raises:
             :class:`fileseq.exceptions.MaxSizeException`:
         """
         # No inverted frame range when range includes subframes
-        for frame in self.items:
-            if not isinstance(frame, (int,)):
-                return ''
-
-        result: list[int] = []
-        frames = sorted(self.items)
-        for idx, frame in enumerate(frames[:-1]):
-            next_frame = frames[idx + 1]
-            if next_frame - frame != 1:
-                r = range(frame + 1, next_frame)
-                # Check if the next update to the result set
-                # will exceed out max frame size.
-                # Prevent memory overflows.
-                self._maxSizeCheck(len(r) + len(result))
-                result += r
-
-        if not result:
+        if self.hasSubFrames():
+            return ''
+
+        # A contiguous run of unique frames has no gaps, which can be
+        # detected without sorting
+        items = self._items
+        if len(items) < 2 or max(items) - min(items) + 1 == len(items):
             return ''
 
+        frames = sorted(items)
+        gaps = [range(frame + 1, next_frame)
+                for frame, next_frame in zip(frames, frames[1:])
+                if next_frame - frame != 1]
+        if not gaps:
+            return ''
+
+        # Check if the result would exceed our max frame size before
+        # building it. Prevent memory overflows.
+        self._maxSizeCheck(sum(map(len, gaps)))
+        result = list(itertools.chain.from_iterable(gaps))
+
         return self.framesToFrameRange(
             result, zfill=zfill, sort=False, compress=False)
 
@@ -514,8 +680,16 @@ class FrameSet(Set):  # type:ignore[type-arg]
         Returns:
             :class:`FrameSet`:
         """
-        return FrameSet(FrameSet.framesToFrameRange(
-            self.items, sort=True, compress=False))
+        # the normalized frames are just the sorted items, so build the
+        # result directly instead of parsing the normalized range string
+        order = tuple(sorted(self._items))
+        if order == self._order:
+            order = self._order
+        fs = FrameSet.__new__(FrameSet)
+        fs._frange = FrameSet.framesToFrameRange(order, sort=False, compress=False)
+        fs._items = self._items
+        fs._order = order
+        return fs
 
     def batches(self, batch_size: int, frames: bool = False) -> typing.Iterator[typing.Any]:
         """
@@ -561,6 +735,7 @@ class FrameSet(Set):  # type:ignore[type-arg]
         Raises:
             ValueError: if state is not an appropriate type
         """
+        self._reset_caches()
         if isinstance(state, tuple):
             # this is to allow unpickling of "3rd generation" FrameSets,
             # which are immutable and may be empty.
@@ -577,7 +752,7 @@ class FrameSet(Set):  # type:ignore[type-arg]
                 self._items = frozenset(state['__set'])
                 self._order = tuple(state['__list'])
             else:
-                for k in self.__slots__:
+                for k in self._DATA_SLOTS:
                     setattr(self, k, state[k])
         else:
             msg = "Unrecognized state data from which to deserialize FrameSet"
@@ -664,7 +839,9 @@ class FrameSet(Set):  # type:ignore[type-arg]
         Returns:
             int:
         """
-        return hash(self.frange) | hash(self.items) | hash(self.order)
+        if self._cached_hash is None:
+            self._cached_hash = hash((self.frange, self._items, self._order))
+        return self._cached_hash
 
     def __lt__(self, other: typing.Any) -> typing.Any:
         """
@@ -709,15 +886,15 @@ class FrameSet(Set):  # type:ignore[type-arg]
             bool:
             :class:`NotImplemented`: if `other` fails to convert to a :class:`FrameSet`
         """
-        other = self._cast_to_frameset(other)
-        if other is NotImplemented:
+        other_items = self._cast_to_items(other)
+        if other_items is NotImplemented:
             return NotImplemented
-        return self.items <= other.items
+        return self.items <= other_items
 
     def __eq__(self, other: typing.Any) -> typing.Any:
         """
-        Check if `self` == `other` via a comparison of the hash of
-        their contents.
+        Check if `self` == `other` via a comparison of their ordered
+        contents.
         If `other` is not a :class:`FrameSet`, but is a set, frozenset, or
         is iterable, it will be cast to a :class:`FrameSet`.
 
@@ -732,14 +909,16 @@ class FrameSet(Set):  # type:ignore[type-arg]
             if not hasattr(other, '__iter__'):
                 return NotImplemented
             other = self.from_iterable(other)
-        this = hash(self.items) | hash(self.order)
-        that = hash(other.items) | hash(other.order)
-        return this == that
+        # the items are exactly the frames in the order, so comparing
+        # the order compares both. Copies and ranges parsed from the same
+        # string share their order, which skips the element comparison.
+        order = other._order
+        return self._order is order or self._order == order
 
     def __ne__(self, other: typing.Any) -> typing.Any:
         """
-        Check if `self` != `other` via a comparison of the hash of
-        their contents.
+        Check if `self` != `other` via a comparison of their ordered
+        contents.
         If `other` is not a :class:`FrameSet`, but is a set, frozenset, or
         is iterable, it will be cast to a :class:`FrameSet`.
 
@@ -768,10 +947,10 @@ class FrameSet(Set):  # type:ignore[type-arg]
             bool:
             :class:`NotImplemented`: if `other` fails to convert to a :class:`FrameSet`
         """
-        other = self._cast_to_frameset(other)
-        if other is NotImplemented:
+        other_items = self._cast_to_items(other)
+        if other_items is NotImplemented:
             return NotImplemented
-        return self.items >= other.items
+        return self.items >= other_items
 
     def __gt__(self, other: typing.Any) -> typing.Any:
         """
@@ -821,10 +1000,14 @@ class FrameSet(Set):  # type:ignore[type-arg]
             :class:`FrameSet`:
             :class:`NotImplemented`: if `other` fails to convert to a :class:`FrameSet`
         """
-        other = self._cast_to_frameset(other)
-        if other is NotImplemented:
+        if other is self:
+            return self._from_frozenset(self.items)
+        other_items = self._cast_to_items(other)
+        if other_items is NotImplemented:
             return NotImplemented
-        return self.from_iterable(self.items & other.items, sort=True)
+        if not self.items or not other_items:
+            return self._empty_frameset()
+        return self._from_frozenset(self.items & other_items)
 
     __rand__ = __and__
 
@@ -845,10 +1028,14 @@ class FrameSet(Set):  # type:ignore[type-arg]
             :class:`FrameSet`:
             :class:`NotImplemented`: if `other` fails to convert to a :class:`FrameSet`
         """
-        other = self._cast_to_frameset(other)
-        if other is NotImplemented:
+        if other is self:
+            return self._empty_frameset()
+        other_items = self._cast_to_items(other)
+        if other_items is NotImplemented:
             return NotImplemented
-        return self.from_iterable(self.items - other.items, sort=True)
+        if not self.items or not other_items:
+            return self._from_frozenset(self.items)
+        return self._from_frozenset(self.items - other_items)
 
     def __rsub__(self, other: typing.Any) -> typing.Any:
         """
@@ -867,10 +1054,14 @@ class FrameSet(Set):  # type:ignore[type-arg]
             :class:`FrameSet`:
             :class:`NotImplemented`: if `other` fails to convert to a :class:`FrameSet`
         """
-        other = self._cast_to_frameset(other)
-        if other is NotImplemented:
+        if other is self:
+            return self._empty_frameset()
+        other_items = self._cast_to_items(other)
+        if other_items is NotImplemented:
             return NotImplemented
-        return self.from_iterable(other.items - self.items, sort=True)
+        if not self.items or not other_items:
+            return self._from_frozenset(other_items)
+        return self._from_frozenset(other_items - self.items)
 
     def __or__(self, other: typing.Any) -> typing.Any:
         """
@@ -890,10 +1081,14 @@ class FrameSet(Set):  # type:ignore[type-arg]
             :class:`FrameSet`:
             :class:`NotImplemented`: if `other` fails to convert to a :class:`FrameSet`
         """
-        other = self._cast_to_frameset(other)
-        if other is NotImplemented:
+        if other is self:
+            return self._from_frozenset(self.items)
+        other_items = self._cast_to_items(other)
+        if other_items is NotImplemented:
             return NotImplemented
-        return self.from_iterable(self.items | other.items, sort=True)
+        if not self.items or not other_items:
+            return self._from_frozenset(self.items or other_items)
+        return self._from_frozenset(self.items | other_items)
 
     __ror__ = __or__
 
@@ -914,10 +1109,14 @@ class FrameSet(Set):  # type:ignore[type-arg]
             :class:`FrameSet`:
             :class:`NotImplemented`: if `other` fails to convert to a :class:`FrameSet`
         """
-        other = self._cast_to_frameset(other)
-        if other is NotImplemented:
+        if other is self:
+            return self._empty_frameset()
+        other_items = self._cast_to_items(other)
+        if other_items is NotImplemented:
             return NotImplemented
-        return self.from_iterable(self.items ^ other.items, sort=True)
+        if not self.items or not other_items:
+            return self._from_frozenset(self.items or other_items)
+        return self._from_frozenset(self.items ^ other_items)
 
     __rxor__ = __xor__
 
@@ -933,10 +1132,14 @@ class FrameSet(Set):  # type:ignore[type-arg]
             bool:
             :class:`NotImplemented`: if `other` fails to convert to a :class:`FrameSet`
         """
-        other = self._cast_to_frameset(other)
-        if other is NotImplemented:
+        if other is self:
+            return not self.items
+        other_items = self._cast_to_items(other)
+        if other_items is NotImplemented:
             return NotImplemented
-        return self.items.isdisjoint(other.items)
+        if not self.items or not other_items:
+            return True
+        return self.items.isdisjoint(other_items)
 
     def issubset(self, other: typing.Any) -> bool | NotImplemented:  # type: ignore
         """
@@ -950,10 +1153,14 @@ class FrameSet(Set):  # type:ignore[type-arg]
             bool:
             :class:`NotImplemented`: if `other` fails to convert to a :class:`FrameSet`
         """
-        other = self._cast_to_frameset(other)
-        if other is NotImplemented:
+        if other is self:
+            return True
+        other_items = self._cast_to_items(other)
+        if other_items is NotImplemented:
             return NotImplemented
-        return self.items <= other.items  # type: ignore
+        if not other_items:
+            return not self.items
+        return self.items <= other_items  # type: ignore
 
     def issuperset(self, other: typing.Any) -> bool | NotImplemented:  # type: ignore
         """
@@ -967,10 +1174,30 @@ class FrameSet(Set):  # type:ignore[type-arg]
             bool:
             :class:`NotImplemented`: if `other` fails to convert to a :class:`FrameSet`
         """
-        other = self._cast_to_frameset(other)
-        if other is NotImplemented:
+        if other is self:
+            return True
+        other_items = self._cast_to_items(other)
+        if other_items is NotImplemented:
             return NotImplemented
-        return self.items >= other.items  # type: ignore
+        if not other_items:
+            return True
+        return self.items >= other_items  # type: ignore
+
+    @staticmethod
+    def _iter_items(others: typing.Iterable[typing.Any]) -> typing.Iterator[typing.Iterable[typing.Any]]:
+        """
+        Internal method: yield set operation operands, using the items of
+        any :class:`FrameSet`. frozenset methods accept any iterable, so
+        other operands are passed through without copying them to a set.
+
+        Args:
+            others (iterable): :class:`FrameSet` or iterables of frames
+
+        Returns:
+            iterator:
+        """
+        for o in others:
+            yield o.items if isinstance(o, FrameSet) else o
 
     def union(self, *other: typing.Any) -> FrameSet:
         """
@@ -983,8 +1210,8 @@ class FrameSet(Set):  # type:ignore[type-arg]
         Returns:
             :class:`FrameSet`:
         """
-        from_frozenset = self.items.union(*(set(o) for o in other))
-        return self.from_iterable(from_frozenset, sort=True)
+        from_frozenset = self.items.union(*self._iter_items(other))
+        return self._from_frozenset(from_frozenset)
 
     def intersection(self, *other: typing.Any) -> FrameSet:
         """
@@ -997,8 +1224,17 @@ class FrameSet(Set):  # type:ignore[type-arg]
         Returns:
             :class:`FrameSet`:
         """
-        from_frozenset = self.items.intersection(*(set(o) for o in other))
-        return self.from_iterable(from_frozenset, sort=True)
+        # intersect smallest first, so the result only shrinks and the
+        # larger operands can be skipped once it is empty
+        operands = sorted(
+            (o if isinstance(o, Set) else frozenset(o) for o in self._iter_items(other)),
+            key=len)
+        from_frozenset = self.items
+        for o in operands:
+            if not from_frozenset:
+                break
+            from_frozenset = from_frozenset.intersection(o)
+        return self._from_frozenset(from_frozenset)
 
     def difference(self, *other: typing.Any) -> FrameSet:
         """
@@ -1011,8 +1247,8 @@ class FrameSet(Set):  # type:ignore[type-arg]
         Returns:
             :class:`FrameSet`:
         """
-        from_frozenset = self.items.difference(*(set(o) for o in other))
-        return self.from_iterable(from_frozenset, sort=True)
+        from_frozenset = self.items.difference(*self._iter_items(other))
+        return self._from_frozenset(from_frozenset)
 
     def symmetric_difference(self, other: typing.Any) -> FrameSet:
         """
@@ -1025,11 +1261,13 @@ class FrameSet(Set):  # type:ignore[type-arg]
         Returns:
             :class:`FrameSet`:
         """
-        other = self._cast_to_frameset(other)
-        if other is NotImplemented:
+        if other is self:
+            return FrameSet._empty_frameset()
+        other_items = self._cast_to_items(other)
+        if other_items is NotImplemented:
             return NotImplemented
-        from_frozenset = self.items.symmetric_difference(other.items)
-        return self.from_iterable(from_frozenset, sort=True)
+        from_frozenset = self.items.symmetric_difference(other_items)
+        return self._from_frozenset(from_frozenset)
 
     def copy(self) -> FrameSet:
         """
@@ -1042,6 +1280,11 @@ class FrameSet(Set):  # type:ignore[type-arg]
         fs._frange = self._frange
         fs._items = self._items
         fs._order = self._order
+        fs._is_consecutive = self._is_consecutive
+        fs._has_subframes = self._has_subframes
+        fs._index_map = self._index_map
+        fs._cached_hash = self._cached_hash
+        fs._frame_range_cache = self._frame_range_cache
         return fs
 
     @classmethod
@@ -1085,28 +1328,31 @@ class FrameSet(Set):  # type:ignore[type-arg]
         """
         # we're willing to trim padding characters from consideration
         # this translation is orders of magnitude faster than prior method
-        frange = str(frange)
-        for key in cls.PAD_MAP:
-            frange = frange.replace(key, '')
+        frange = str(frange).translate(_padStripTable(''.join(cls.PAD_MAP)))
 
         if not frange:
             return True
 
+        parse_part = cls._parse_frange_part
         for part in asString(frange).split(','):
             if not part:
                 continue
             try:
-                cls._parse_frange_part(part)
+                parse_part(part)
             except ParseException:
                 return False
 
         return True
 
     @classmethod
+    @functools.lru_cache(maxsize=2048, typed=True)
     def padFrameRange(cls, frange: str, zfill: int, decimal_places: int | None = None) -> str:
         """
         Return the zero-padded version of the frame range string.
 
+        The same frame ranges tend to be padded over and over, such as when
+        formatting the paths of a sequence, so results are cached.
+
         Args:
             frange (str): a frame range to test
             zfill (int):
@@ -1120,24 +1366,159 @@ class FrameSet(Set):  # type:ignore[type-arg]
             """
             Substitutes padded for unpadded frames.
             """
-            result = list(match.groups())
+            neg, start, dash, end_neg, end, modifier, chunk = match.groups()
+            result = pad(neg + start, zfill, decimal_places)
+            if end:
+                result += dash + pad(end_neg + end, zfill, decimal_places)
+                if modifier:
+                    result += modifier + chunk
+            return result
 
-            neg, start = result[:2]
-            result[:2] = [pad(neg + start, zfill, decimal_places)]
+        return cls.PAD_RE.sub(_do_pad, frange)
 
-            neg, end = result[2:4]
-            if end:
-                result[2:4] = [pad(neg + end, zfill, decimal_places)]
+    @classmethod
+    def _parse_frange(cls, frange: str, maxSize: int) -> tuple[frozenset[int], tuple[int, ...]]:
+        """
+        Internal method: parse a full frame range string into its
+        unique frames and their order.
 
-            return ''.join((i for i in result if i))
+        The same frame ranges tend to be parsed over and over, so results
+        of up to ``_PARSE_CACHE_MAX_FRAMES`` frames are cached. Larger
+        results are not kept, so they do not hold on to their memory after
+        the :class:`FrameSet` is gone. The immutable results can be safely
+        shared between :class:`FrameSet` instances. The max frame size is
+        part of the cache key, so changes to
+        ``fileseq.constants.MAX_FRAME_SIZE`` are respected.
 
-        return cls.PAD_RE.sub(_do_pad, frange)
+        Args:
+            frange (str): frame range string, with padding characters removed
+            maxSize (int): the current ``fileseq.constants.MAX_FRAME_SIZE``
+
+        Returns:
+            tuple: (frozenset of frames, tuple of ordered frames)
+
+        Raises:
+            :class:`.ParseException`: if the frame range
+                (or a portion of it) could not be parsed.
+            :class:`fileseq.exceptions.MaxSizeException`: if the range exceeds
+                ``maxSize``
+        """
+        cache = FrameSet._PARSE_CACHE
+        key = (cls, frange, maxSize)
+        result = cache.get(key)
+        if result is None:
+            result = cls._build_frange(frange, maxSize)
+            if len(result[1]) <= cls._PARSE_CACHE_MAX_FRAMES:
+                # start over once full, which is simple and thread-safe
+                if len(cache) >= cls._PARSE_CACHE_SIZE:
+                    cache.clear()
+                cache[key] = result
+        return result
 
     @classmethod
+    def _build_frange(cls, frange: str, maxSize: int) -> tuple[frozenset[int], tuple[int, ...]]:
+        """
+        Internal method: parse a full frame range string into its
+        unique frames and their order, without caching.
+
+        Args:
+            frange (str): frame range string, with padding characters removed
+            maxSize (int): the current ``fileseq.constants.MAX_FRAME_SIZE``
+
+        Returns:
+            tuple: (frozenset of frames, tuple of ordered frames)
+
+        Raises:
+            :class:`.ParseException`: if the frame range
+                (or a portion of it) could not be parsed.
+            :class:`fileseq.exceptions.MaxSizeException`: if the range exceeds
+                ``maxSize``
+        """
+        # build the mutable stores, then cast to immutable for storage
+        items: typing.Set[int] = set()
+        # the deduplicated frames of each part, joined once at the end
+        order_parts: typing.List[typing.List[int]] = []
+
+        frange_parts: typing.List[typing.Any] = []
+        frange_types: typing.List[typing.Any] = []
+        parse_part = cls._parse_frange_part
+        for part in frange.split(","):
+            # this is to deal with leading / trailing commas
+            if not part:
+                continue
+            # parse the partial range
+            start, end, modifier, chunk = parse_part(part)
+            frange_parts.append((start, end, modifier, chunk))
+            frange_types.extend(map(type, (start, end, chunk)))
+
+        # Determine best type for numbers in range. Note that
+        # _parse_frange_part will always return decimal.Decimal for subframes
+        FrameType = int
+        if decimal.Decimal in frange_types:
+            FrameType = decimal.Decimal  # type: ignore
+
+        # Integer ranges can be iterated as a builtin range, without
+        # the generator xfrange uses to also support subframes
+        rangeFunc: typing.Callable[..., typing.Iterable[typing.Any]] = xfrange
+        if FrameType is int:
+            rangeFunc = _intFrameRange
+
+        def addFrames(frames: typing.List[typing.Any]) -> None:
+            # frames within a single part are already unique, so only
+            # filter when the part overlaps frames from a previous part
+            if not items:
+                cls._maxSizeCheck(len(frames))
+                order_parts.append(frames)
+                items.update(frames)
+                return
+            new = set(frames)
+            dups = new & items
+            if dups:
+                frames = [f for f in frames if f not in dups]
+                new -= dups
+            cls._maxSizeCheck(len(frames) + len(items))
+            order_parts.append(frames)
+            items.update(new)
+
+        for start, end, modifier, chunk in frange_parts:
+            # handle batched frames (1-100x5)
+            if modifier == 'x':
+                frames = rangeFunc(start, end, chunk, maxSize=maxSize)
+                addFrames(list(frames) if FrameType is int else [FrameType(f) for f in frames])
+            # handle staggered frames (1-100:5)
+            elif modifier == ':':
+                if not isinstance(chunk, int):
+                    raise ValueError("Unable to stagger subframes")
+                # the staggers combine into the full range, so check its
+                # size up front instead of after building every stagger
+                rangeFunc(start, end, 1, maxSize=maxSize)
+                for stagger in range(chunk, 0, -1):
+                    addFrames(list(rangeFunc(start, end, stagger, maxSize=maxSize)))
+            # handle filled frames (1-100y5)
+            elif modifier == 'y':
+                if not isinstance(chunk, int):
+                    raise ValueError("Unable to fill subframes")
+                # drop every chunk'th frame from the start in a single pass
+                frames = rangeFunc(start, end, 1, maxSize=maxSize)
+                addFrames([f for f in frames if (f - start) % chunk])
+            # handle full ranges and single frames
+            else:
+                frames = rangeFunc(start, end, 1 if start < end else -1, maxSize=maxSize)
+                addFrames(list(frames) if FrameType is int else [FrameType(f) for f in frames])
+
+        # lock the results into immutable internals
+        # this allows for hashing and fast equality checking
+        return frozenset(items), tuple(itertools.chain.from_iterable(order_parts))
+
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
     def _parse_frange_part(cls, frange: str) -> tuple[int, int, str, int]:
         """
         Internal method: parse a discrete frame range part.
 
+        Parts repeat often, such as in :meth:`isFrameRange` checks, so
+        results are cached. Parts that fail to parse are not cached.
+
         Args:
             frange (str): single part of a frame range as a string
                 (ie "1-100x5")
@@ -1149,7 +1530,7 @@ class FrameSet(Set):  # type:ignore[type-arg]
             :class:`.ParseException`: if the frame range can
                 not be parsed
         """
-        match = cls.FRANGE_RE.match(frange)
+        match = cls.FRANGE_RE.fullmatch(frange)
         if not match:
             msg = 'Could not parse "{0}": did not match {1}'
             raise ParseException(msg.format(frange, cls.FRANGE_RE.pattern))
@@ -1186,10 +1567,10 @@ class FrameSet(Set):  # type:ignore[type-arg]
         if stop is None:
             return ''
         pad_start = pad(start, zfill)
-        pad_stop = pad(stop, zfill)
         if stride is None or start == stop:
-            return '{0}'.format(pad_start)
-        elif abs(stride) == 1:
+            return pad_start
+        pad_stop = pad(stop, zfill)
+        if abs(stride) == 1:
             return '{0}-{1}'.format(pad_start, pad_stop)
         else:
             stride = normalizeFrame(stride)
@@ -1249,64 +1630,61 @@ class FrameSet(Set):  # type:ignore[type-arg]
         return FrameSet._build_frange_part(start, stop, stride, zfill=zfill)
 
     @staticmethod
-    def framesToFrameRanges(
-            frames: typing.Iterable[typing.Any],
-            zfill: int = 0
-        ) -> typing.Iterator[str]:
+    def _frameRuns(frames: list[typing.Any]) -> typing.Iterator[tuple[typing.Any, ...]]:
         """
-        Converts a sequence of frames to a series of padded
-        frame range strings.
+        Private method: splits a non-empty list of frames of a single type
+        into runs with a constant stride, for :meth:`framesToFrameRanges`.
+
+        Strides between decimal frames may differ only because the frames
+        were rounded. Those frames stay in the same run as long as a single
+        stride rounds to all of them, and the limits of that stride are
+        tracked.
 
         Args:
-            frames (collections.Iterable): sequence of frames to process
-            zfill (int): width for zero padding
+            frames (list): sequence of frames to process
 
         Yields:
-            str:
+            tuple: (start, stop, stride, count, min_stride, max_stride).
+            A single frame has a count of 1 and no stride. The stride of a
+            decimal run is None if it is only known within its limits, and
+            the limits are None for other frame types.
         """
-        _build = FrameSet._build_frange_part
-        _build_decimal = FrameSet._build_frange_part_decimal
-
-        # Ensure all frame values are of same type
-        frames = normalizeFrames(frames)
+        is_decimal = isinstance(frames[0], decimal.Decimal)
+        one = decimal.Decimal(1)
 
-        curr_start = None
+        curr_start = last_frame = frames[0]
         curr_stride = None
         curr_strides = None  # used for decimal frame handling only
         curr_min_stride = None  # used for decimal frame handling only
         curr_max_stride = None  # used for decimal frame handling only
-        curr_frame = None
-        last_frame = None
-        curr_count = 0
-        for curr_frame in frames:
-            if curr_start is None:
-                curr_start = curr_frame
-                last_frame = curr_frame
-                curr_count += 1
-                continue
-            if curr_stride is None:
-                curr_stride = abs(curr_frame - curr_start)
-                curr_strides = {curr_stride}
+        curr_count = 1
+        for curr_frame in itertools.islice(frames, 1, None):
             new_stride = abs(curr_frame - last_frame)
+            if curr_stride is None:
+                curr_stride = new_stride
+                if is_decimal:
+                    curr_strides = {curr_stride}
 
             # Handle decimal strides and frame rounding
-            if isinstance(curr_stride, decimal.Decimal):
+            if is_decimal:
                 # Check whether stride difference could be caused by rounding
                 if len(curr_strides) == 1:
                     stride_delta = abs(curr_stride - new_stride)
                     exponent = stride_delta.as_tuple().exponent
-                    max_stride_delta = decimal.Decimal(1).scaleb(exponent)
+                    max_stride_delta = one.scaleb(exponent)
                     if stride_delta <= max_stride_delta:
                         curr_strides.add(new_stride)
 
                 if new_stride in curr_strides:
+                    half_delta = max_stride_delta / 2
+
                     # Find minimum frame value that rounds to current
-                    min_frame = (curr_frame - max_stride_delta / 2)
+                    min_frame = (curr_frame - half_delta)
                     while min_frame.quantize(curr_frame) != curr_frame:
                         min_frame = min_frame.next_plus()
 
                     # Find maximum frame value that rounds to current
-                    max_frame = (curr_frame + max_stride_delta / 2)
+                    max_frame = (curr_frame + half_delta)
                     while max_frame.quantize(curr_frame) != curr_frame:
                         max_frame = max_frame.next_minus()
 
@@ -1341,38 +1719,65 @@ class FrameSet(Set):  # type:ignore[type-arg]
             if curr_stride == new_stride:
                 curr_count += 1
             elif curr_count == 2 and curr_stride != 1:
-                yield _build(curr_start, curr_start, None, zfill)
+                yield curr_start, curr_start, None, 1, None, None
                 curr_start = last_frame
                 curr_stride = new_stride
-                curr_strides = {new_stride}
+                curr_strides = {new_stride} if is_decimal else None
                 curr_min_stride = None
                 curr_max_stride = None
             else:
-                if isinstance(curr_stride, decimal.Decimal):
-                    stride = curr_strides.pop() if len(curr_strides) == 1 else None
-                    yield _build_decimal(curr_start, last_frame, curr_count,
-                                         stride, curr_min_stride, curr_max_stride, zfill)
-                else:
-                    yield _build(curr_start, last_frame, curr_stride, zfill)
+                stride = curr_stride if curr_strides is None or len(curr_strides) == 1 else None
+                yield curr_start, last_frame, stride, curr_count, curr_min_stride, curr_max_stride
                 curr_stride = None
                 curr_strides = None
                 curr_min_stride = None
                 curr_max_stride = None
                 curr_start = curr_frame
                 curr_count = 1
-
             last_frame = curr_frame
 
         if curr_count == 2 and curr_stride != 1:
-            yield _build(curr_start, curr_start, None, zfill)
-            yield _build(curr_frame, curr_frame, None, zfill)
+            yield curr_start, curr_start, None, 1, None, None
+            yield last_frame, last_frame, None, 1, None, None
         else:
-            if isinstance(curr_stride, decimal.Decimal):
-                stride = curr_strides.pop() if len(curr_strides) == 1 else None
-                yield _build_decimal(curr_start, curr_frame, curr_count,
-                                     stride, curr_min_stride, curr_max_stride, zfill)
+            stride = curr_stride if curr_strides is None or len(curr_strides) == 1 else None
+            yield curr_start, last_frame, stride, curr_count, curr_min_stride, curr_max_stride
+
+    @staticmethod
+    def framesToFrameRanges(
+            frames: typing.Iterable[typing.Any],
+            zfill: int = 0
+        ) -> typing.Iterator[str]:
+        """
+        Converts a sequence of frames to a series of padded
+        frame range strings.
+
+        Args:
+            frames (collections.Iterable): sequence of frames to process
+            zfill (int): width for zero padding
+
+        Yields:
+            str:
+        """
+        _build = FrameSet._build_frange_part
+        _build_decimal = FrameSet._build_frange_part_decimal
+
+        # Ensure all frame values are of same type
+        frames = normalizeFrames(frames)
+
+        # no frames make a single empty range
+        if not frames:
+            yield ''
+            return
+
+        # with a single frame type, only decimal frames have decimal strides
+        is_decimal = isinstance(frames[0], decimal.Decimal)
+
+        for start, stop, stride, count, min_stride, max_stride in FrameSet._frameRuns(frames):
+            if is_decimal and count > 1:
+                yield _build_decimal(start, stop, count, stride, min_stride, max_stride, zfill)
             else:
-                yield _build(curr_start, curr_frame, curr_stride, zfill)
+                yield _build(start, stop, stride, zfill)
 
     @staticmethod
     def framesToFrameRange(
@@ -1394,8 +1799,19 @@ class FrameSet(Set):  # type:ignore[type-arg]
         Returns:
             str:
         """
+        # a range already describes a single run of unique frames
+        if isinstance(frames, range) and len(frames) > 2:
+            if sort and frames.step < 0:
+                frames = frames[::-1]
+            start = str(frames[0]).zfill(zfill)
+            stop = str(frames[-1]).zfill(zfill)
+            stride = abs(frames.step)
+            if stride == 1:
+                return '{0}-{1}'.format(start, stop)
+            return '{0}-{1}x{2}'.format(start, stop, stride)
+
         if compress:
-            frames = unique(set(), frames)
+            frames = dict.fromkeys(frames)
         frames = list(frames)
         if not frames:
             return ''
@@ -405,6 +405,10 @@ def pad(number: typing.Any, width: typing.Optional[int] = 0, decimal_places: typ
         str:
     """
 
+    # Integer frames have no decimal places to handle
+    if decimal_places is None and type(number) is int:
+        return str(number).zfill(width)  # type:ignore[arg-type]
+
     # Make the common case fast. Truncate to integer value as USD does.
     # https://graphics.pixar.com/usd/docs/api/_usd__page__value_clips.html
     # See _DeriveClipTimeString for formatting of templateAssetPath
@@ -447,6 +447,15 @@ class TestFrameSet(unittest.TestCase):
             self.assertEqual(actual, expected)
             self.assertEqual(case.has_subframes, f.hasSubFrames())
 
+    def testHasSubFramesCache(self):
+        fs = FrameSet('1-3,2.5')
+        self.assertTrue(fs.hasSubFrames())
+        self.assertTrue(fs.hasSubFrames())
+        self.assertTrue(fs.copy().hasSubFrames())
+        self.assertFalse(FrameSet.from_range(1, 5).hasSubFrames())
+        self.assertFalse((FrameSet('1-3') | FrameSet('5')).hasSubFrames())
+        self.assertTrue((FrameSet('1-3') | FrameSet('2.5')).hasSubFrames())
+
     def testMaxFrameSize(self):
         _maxSize = constants.MAX_FRAME_SIZE
         try:
@@ -460,6 +469,9 @@ class TestFrameSet(unittest.TestCase):
             # Should not be allowed
             self.assertRaises(exceptions.MaxSizeException, utils.xfrange, 1, 100, 1, maxSize=50)
             self.assertRaises(exceptions.MaxSizeException, FrameSet, '1-%d' % (maxSize + 1))
+            self.assertRaises(exceptions.MaxSizeException, FrameSet, '1-%d:5' % (maxSize + 1))
+            self.assertRaises(exceptions.MaxSizeException, FrameSet, '1-%dy5' % (maxSize + 1))
+            self.assertRaises(exceptions.MaxSizeException, FrameSet, '1-%d,%d-%d' % (maxSize, maxSize + 1, maxSize + 2))
 
             # Inverting would produce a huge new range
             fs = FrameSet('1,%d' % (maxSize + 3))
@@ -468,6 +480,149 @@ class TestFrameSet(unittest.TestCase):
         finally:
             constants.MAX_FRAME_SIZE = _maxSize
 
+    def testParseCache(self):
+        a = FrameSet('1-100x2,200')
+        b = FrameSet('1-100x2,200')
+        self.assertEqual(a, b)
+        self.assertIs(a._items, b._items)
+        self.assertIs(a._order, b._order)
+        self.assertIs(FrameSet._parse_frange_part('1-10x2'),
+                      FrameSet._parse_frange_part('1-10x2'))
+        for _ in range(2):
+            self.assertRaises(exceptions.ParseException, FrameSet._parse_frange_part, '1-10x0')
+            self.assertFalse(FrameSet.isFrameRange('1-10x0'))
+
+        # Large parses are not kept alive by the cache
+        big = '1-%d' % (FrameSet._PARSE_CACHE_MAX_FRAMES + 1)
+        self.assertIsNot(FrameSet(big)._order, FrameSet(big)._order)
+        self.assertFalse(any(key[1] == big for key in FrameSet._PARSE_CACHE))
+
+        # A cached parse must not bypass a lowered max frame size
+        FrameSet('1-600')
+        _maxSize = constants.MAX_FRAME_SIZE
+        try:
+            constants.MAX_FRAME_SIZE = 500
+            self.assertRaises(exceptions.MaxSizeException, FrameSet, '1-600')
+        finally:
+            constants.MAX_FRAME_SIZE = _maxSize
+
+    def testIndex(self):
+        fs = FrameSet('10-1x3,20,5.5')
+        for i, frame in enumerate(fs):
+            self.assertEqual(fs.index(frame), i)
+        self.assertEqual(fs.index(Decimal('5.5')), 5)
+        self.assertEqual(fs.copy().index(20), 4)
+        self.assertRaises(ValueError, fs.index, 2)
+        self.assertRaises(ValueError, fs.index, [1])
+        self.assertRaises(ValueError, FrameSet('').index, 1)
+
+    def testHash(self):
+        fs = FrameSet('1-10x2,20')
+        self.assertEqual(hash(fs), hash(fs))
+        self.assertEqual(hash(fs), hash(FrameSet('1-10x2,20')))
+        self.assertEqual(hash(fs), hash(fs.copy()))
+        self.assertEqual(hash(fs), hash(pickle.loads(pickle.dumps(fs))))
+        self.assertNotEqual(FrameSet('1-5'), FrameSet('5-1'))
+        self.assertEqual(FrameSet('1-3'), FrameSet('1,2,3'))
+        self.assertTrue(fs == fs.copy())
+        self.assertFalse(fs != FrameSet('1-10x2,20'))
+
+    def testPickleProtocols(self):
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            fs = pickle.loads(pickle.dumps(FrameSet('1-5,10'), protocol))
+            self.assertEqual(list(fs), [1, 2, 3, 4, 5, 10])
+            self.assertFalse(fs.isConsecutive())
+            self.assertFalse(fs.hasSubFrames())
+            self.assertEqual(fs.index(10), 5)
+            self.assertEqual(hash(fs), hash(FrameSet('1-5,10')))
+            self.assertEqual(fs.frameRange(3), '001-005,010')
+            self.assertEqual(FrameSet(fs), fs)
+            self.assertEqual(fs.copy(), fs)
+
+    def testInitFromFrameSetLike(self):
+        src = FrameSet('1-10x3')
+        self.assertEqual(list(FrameSet(src)), [1, 4, 7, 10])
+
+        class Standin(object):
+            _frange = src._frange
+            _items = src._items
+            _order = src._order
+
+        fs = FrameSet(Standin())
+        self.assertEqual(fs.frange, '1-10x3')
+        self.assertEqual(list(fs), [1, 4, 7, 10])
+        self.assertFalse(fs.isConsecutive())
+
+    def testLazyFrameRange(self):
+        fs = FrameSet([5, 1, 2, 3])
+        self.assertIsNone(fs._frange)
+        self.assertFalse(fs.is_null)
+        self.assertEqual(list(fs), [5, 1, 2, 3])
+        self.assertEqual(pickle.loads(pickle.dumps(fs)).frange, '5,1-3')
+        self.assertEqual(fs.frange, '5,1-3')
+        self.assertEqual(fs._frange, '5,1-3')
+        self.assertEqual(FrameSet({3, 1, 2}).frange, '1-3')
+        self.assertTrue(FrameSet([]).is_null)
+        self.assertEqual(FrameSet([]).frange, '')
+
+    def testIntersectionMany(self):
+        fs = FrameSet('1-100')
+        self.assertEqual(fs.intersection(), fs)
+        self.assertEqual(
+            list(fs.intersection(FrameSet('50-200'), [1, 2, 50, 51], {51, 52})), [51])
+        self.assertEqual(list(fs.intersection(range(5), [])), [])
+        self.assertEqual(list(fs.intersection([200], range(1000000))), [])
+
+    def testEmptySetOpResult(self):
+        fs = FrameSet('1-10')
+        empty = fs - fs
+        self.assertIs(fs & FrameSet('20-30'), empty)
+        self.assertIs(fs ^ FrameSet('1-10'), empty)
+        self.assertTrue(empty.is_null)
+        self.assertEqual(empty, FrameSet(''))
+        self.assertEqual(empty.frange, '')
+        self.assertEqual(empty.frameRange(4), '')
+        self.assertEqual(len(empty), 0)
+        self.assertEqual(list(empty | FrameSet('1-3')), [1, 2, 3])
+
+    def testInvertedFrameRangeUnordered(self):
+        self.assertEqual(FrameSet('5,1-4').invertedFrameRange(), '')
+        self.assertEqual(FrameSet('1,5,2,4').invertedFrameRange(), '3')
+        self.assertEqual(FrameSet('7').invertedFrameRange(), '')
+        self.assertEqual(FrameSet('').invertedFrameRange(), '')
+
+    def testFramesToFrameRangeFromRange(self):
+        for frames in (range(1, 11), range(-10, 11, 3), range(10, -5, -2), range(5, 7)):
+            for sort in (True, False):
+                for zfill in (0, 4):
+                    self.assertEqual(
+                        FrameSet.framesToFrameRange(frames, sort=sort, zfill=zfill),
+                        FrameSet.framesToFrameRange(list(frames), sort=sort, zfill=zfill))
+        self.assertEqual(FrameSet.framesToFrameRange(range(10, -5, -2)), '-4-10x2')
+        self.assertEqual(FrameSet.framesToFrameRange(range(10, -5, -2), sort=False), '10--4x2')
+
+    def testFrameRangeCache(self):
+        fs = FrameSet('1-10x3')
+        self.assertEqual(fs.frameRange(), '1-10x3')
+        self.assertEqual(fs.frameRange(3), '001-010x3')
+        self.assertEqual(fs.frameRange(), '1-10x3')
+        self.assertEqual(fs.invertedFrameRange(), '2-3,5-6,8-9')
+        self.assertEqual(fs.invertedFrameRange(2), '02-03,05-06,08-09')
+        self.assertEqual(fs.copy().invertedFrameRange(), '2-3,5-6,8-9')
+
+        # A cached result must not accept a width the uncached call rejects
+        self.assertRaises(TypeError, fs.frameRange, 3.0)
+        self.assertRaises(TypeError, fs.invertedFrameRange, 2.0)
+
+        # A cached result must not bypass a lowered max frame size
+        _maxSize = constants.MAX_FRAME_SIZE
+        try:
+            constants.MAX_FRAME_SIZE = 5
+            self.assertRaises(exceptions.MaxSizeException, fs.invertedFrameRange)
+        finally:
+            constants.MAX_FRAME_SIZE = _maxSize
+        self.assertEqual(600, len(FrameSet('1-600')))
+
     def test2FramesContiguous(self):
         table = [
             ([1, 2], "1-2"),
@@ -508,12 +663,17 @@ class TestFrameSet(unittest.TestCase):
         ]
 
         for t in consec:
-            self.assertTrue(FrameSet(t).isConsecutive(),
+            fs = FrameSet(t)
+            self.assertTrue(fs.isConsecutive(),
                             "Expected %s to be consecutive" % t)
+            # cached result carries over to copies
+            self.assertTrue(fs.copy().isConsecutive())
 
         for t in nonconsec:
-            self.assertFalse(FrameSet(t).isConsecutive(),
+            fs = FrameSet(t)
+            self.assertFalse(fs.isConsecutive(),
                              "Expected %s to not be consecutive" % t)
+            self.assertFalse(FrameSet(fs).isConsecutive())
 
     def testSlicing(self):
         Case = namedtuple('Case', ['input', 'slice', 'expected'])
@@ -665,6 +825,13 @@ class _CustomPathString(str):
         return self._create(super(_CustomPathString, self).__getitem__(item))
 
 
+class _CustomFileSequence(FileSequence):
+    """
+    Subclass that does not define __slots__, and
+    can therefore store extra instance attributes
+    """
+
+
 class TestFileSequence(TestBase):
 
     def testToStr(self):
@@ -693,6 +860,32 @@ class TestFileSequence(TestBase):
         actual = str(fs)
         self.assertEqual("/dir/file..ext", actual)
 
+    def testToStrAfterSetters(self):
+        seq = FileSequence("/dir/file.1-5#.ext")
+        self.assertEqual("/dir/file.1-5#.ext", str(seq))
+
+        seq.setDirname("/other/")
+        self.assertEqual("/other/file.1-5#.ext", str(seq))
+        seq.setBasename("name.")
+        self.assertEqual("/other/name.1-5#.ext", str(seq))
+        seq.setExtension("exr")
+        self.assertEqual("/other/name.1-5#.exr", str(seq))
+        seq.setPadding("@@")
+        self.assertEqual("/other/name.1-5@@.exr", str(seq))
+        seq.setFramePadding("#")
+        self.assertEqual("/other/name.1-5#.exr", str(seq))
+        seq.setPadStyle(constants.PAD_STYLE_HASH1)
+        self.assertEqual("/other/name.1-5####.exr", str(seq))
+        seq.setFrameRange("10-20")
+        self.assertEqual("/other/name.10-20####.exr", str(seq))
+        seq.setFrameSet(FrameSet("1-3"))
+        self.assertEqual("/other/name.1-3####.exr", str(seq))
+
+        copied = seq.copy()
+        copied.setBasename("copy.")
+        self.assertEqual("/other/name.1-3####.exr", str(seq))
+        self.assertEqual("/other/copy.1-3####.exr", str(copied))
+
     def testEqual(self):
         @dataclasses.dataclass
         class Case:
@@ -986,6 +1179,19 @@ class TestFileSequence(TestBase):
         seq = FileSequence("/cheech/chong.1,3,5#.exr")
         self.assertFalse(known.difference(seq))
 
+    def testIterMatchesFrame(self):
+        for pattern in (
+            "/cheech/chong.-3-3#.exr",
+            "/cheech/chong.1-10x3@@.exr",
+            "/cheech/chong.1-5%02d.exr",
+            "/cheech/chong.1-2x0.25#.##.exr",
+        ):
+            seq = FileSequence(pattern, allow_subframes=True)
+            expected = [seq.frame(f) for f in seq.frameSet()]
+            self.assertEqual(expected, list(seq))
+            for path in seq:
+                self.assertNativeStr(path)
+
     def testSlicing(self):
         Case = namedtuple('Case', ['input', 'slice', 'expected'])
         table = [
@@ -1109,6 +1315,12 @@ class TestFileSequence(TestBase):
         self.assertEquals(len(fs), len(fs2))
         self.assertEquals(list(fs), list(fs2))
 
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            fs2 = pickle.loads(pickle.dumps(fs, protocol))
+            self.assertEquals(str(fs), str(fs2))
+            self.assertEquals(list(fs), list(fs2))
+            self.assertFalse(fs2.frameSet().isConsecutive())
+
         fs = FileSequence("/path/to/file.1-100x2%04d.exr")
         s = pickle.dumps(fs, pickle.HIGHEST_PROTOCOL)
         fs2 = pickle.loads(s)
@@ -1135,7 +1347,20 @@ class TestFileSequence(TestBase):
         self.assertEquals(list(fs), list(fs2))
         self.assertEquals(fs.frameSet(), fs2.frameSet())
         self.assertEquals(fs.padStyle(), fs2.padStyle())
-        self.assertEquals(fs.__dict__, fs2.__dict__)
+        self.assertEquals(fs.to_dict(), fs2.to_dict())
+
+    def testSerializationSubclass(self):
+        fs = _CustomFileSequence("/path/to/file.1-100x2#.exr")
+        fs.extra = "value"
+        fs2 = pickle.loads(pickle.dumps(fs, pickle.HIGHEST_PROTOCOL))
+        self.assertIsInstance(fs2, _CustomFileSequence)
+        self.assertEquals(str(fs), str(fs2))
+        self.assertEquals("value", fs2.extra)
+
+        fs3 = fs.copy()
+        self.assertIsInstance(fs3, _CustomFileSequence)
+        self.assertEquals(str(fs), str(fs3))
+        self.assertEquals("value", fs3.extra)
 
     def testHasVersionNoFrame(self):
         for allow_subframes in [False, True]:
@@ -2167,6 +2392,12 @@ class TestPaddingFunctions(TestBase):
             self.assertEqual(actual, case.expected, str(case))
             self.assertNativeStr(actual)
 
+        # cached results are keyed on every argument
+        self.assertEqual(padFrameRange('1-10', 4), '0001-0010')
+        self.assertEqual(padFrameRange('1-10', 4), '0001-0010')
+        self.assertEqual(padFrameRange('1-10', 4, 2), '0001.00-0010.00')
+        self.assertEqual(padFrameRange('1-10', 2), '01-10')
+
     def testFilterByPaddingNum(self):
         class Case(object):
             def __init__(self, paths, pad, expected, has_padded):